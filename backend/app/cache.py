@@ -0,0 +1,50 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+
+class CandidateCache:
+    """Bounded in-process LRU of serialized candidates, keyed by id and tagged with the row version."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[int, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, candidate_id: int, version: int) -> Dict[str, Any] | None:
+        with self._lock:
+            entry = self._items.get(candidate_id)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                # Only evict when the caller has seen a newer row; a caller holding
+                # an older version must not drop a fresher entry.
+                if entry[0] < version:
+                    del self._items[candidate_id]
+                return None
+            self._items.move_to_end(candidate_id)
+            return entry[1]
+
+    def set(self, candidate_id: int, version: int, payload: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            entry = self._items.get(candidate_id)
+            if entry is not None and entry[0] > version:
+                return
+            self._items[candidate_id] = (version, payload)
+            self._items.move_to_end(candidate_id)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def invalidate(self, candidate_id: int) -> None:
+        with self._lock:
+            self._items.pop(candidate_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+candidate_cache = CandidateCache(int(os.getenv("CANDIDATE_CACHE_SIZE", "1024")))
@@ -12,6 +12,7 @@ class Candidate(Base):
     location_city = Column(String(128), index=True)
     raw_paragraph = Column(Text)
     cv_text = Column(Text)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     experiences = relationship("Experience", back_populates="candidate", cascade="all, delete-orphan")
     education = relationship("Education", back_populates="candidate", cascade="all, delete-orphan")
@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session, selectinload
+from ..cache import candidate_cache
 from ..db import SessionLocal
 from ..models import Candidate
-from ..schemas import CandidateOut
+from ..schemas import CandidateBatchOut, CandidateOut, CandidatePartialOut, EducationIn, ExperienceIn
 
 router = APIRouter()
 
+MAX_BATCH_IDS = 100
+CANDIDATE_FIELDS = tuple(CandidateOut.model_fields)
+CHILD_FIELDS = {"education": EducationIn, "experiences": ExperienceIn}
+
 def get_db():
     db = SessionLocal()
     try:
@@ -13,9 +19,129 @@ def get_db():
     finally:
         db.close()
 
-@router.get("/{candidate_id:int}", response_model=CandidateOut)
-def get_candidate(candidate_id: int, db: Session = Depends(get_db)):
-    cand = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+def _parse_fields(fields: Optional[str]) -> tuple[str, ...] | None:
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in CANDIDATE_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    # id and version are always returned so callers can correlate and revalidate.
+    return tuple(f for f in CANDIDATE_FIELDS if f in {"id", "version", *requested})
+
+def _parse_ids(ids: str) -> List[int]:
+    try:
+        parsed = [int(i) for i in ids.split(",") if i.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    if not parsed:
+        raise HTTPException(status_code=400, detail="ids must not be empty")
+    parsed = list(dict.fromkeys(parsed))
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    return parsed
+
+def _etag(candidate_id: int, version: int, projection: tuple[str, ...] | None) -> str:
+    tag = f"{candidate_id}-{version}"
+    if projection is not None:
+        tag += "-" + ".".join(projection)
+    return f'"{tag}"'
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return etag in candidates
+
+def _serialize(cand: Candidate, projection: tuple[str, ...] | None) -> Dict[str, Any]:
+    if projection is None:
+        return CandidateOut.model_validate(cand, from_attributes=True).model_dump()
+    out: Dict[str, Any] = {}
+    for name in projection:
+        value = getattr(cand, name)
+        if name in CHILD_FIELDS:
+            value = [CHILD_FIELDS[name].model_validate(v, from_attributes=True).model_dump() for v in value]
+        out[name] = value
+    return out
+
+def _project(payload: Dict[str, Any], projection: tuple[str, ...] | None) -> Dict[str, Any]:
+    if projection is None:
+        return payload
+    return {name: payload[name] for name in projection}
+
+def _load_options(projection: tuple[str, ...] | None) -> list:
+    wanted = CHILD_FIELDS if projection is None else [f for f in projection if f in CHILD_FIELDS]
+    return [selectinload(getattr(Candidate, name)) for name in wanted]
+
+# Projected responses omit unrequested fields rather than returning them as null.
+@router.get("", response_model=CandidateBatchOut, response_model_exclude_unset=True)
+def get_candidates(ids: str, fields: Optional[str] = None, db: Session = Depends(get_db)):
+    id_list = _parse_ids(ids)
+    projection = _parse_fields(fields)
+
+    versions = dict(db.query(Candidate.id, Candidate.version).filter(Candidate.id.in_(id_list)).all())
+    found: Dict[int, Dict[str, Any]] = {}
+    missing = []
+    for cid, version in versions.items():
+        cached = candidate_cache.get(cid, version)
+        if cached is not None:
+            found[cid] = _project(cached, projection)
+        else:
+            missing.append(cid)
+
+    if missing:
+        rows = db.query(Candidate).options(*_load_options(projection)).filter(Candidate.id.in_(missing)).all()
+        for cand in rows:
+            found[cand.id] = _serialize(cand, projection)
+            if projection is None:
+                candidate_cache.set(cand.id, cand.version, found[cand.id])
+
+    items = [found[cid] for cid in id_list if cid in found]
+    return {"count": len(items), "items": items}
+
+@router.get(
+    "/{candidate_id:int}",
+    response_model=CandidatePartialOut,
+    response_model_exclude_unset=True,
+    responses={304: {"description": "Not modified since the ETag sent in If-None-Match"}},
+)
+def get_candidate(
+    candidate_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    projection = _parse_fields(fields)
+
+    # Cheap primary-key lookup of the version only; the full row and its
+    # children are loaded below just when neither the client nor the cache has it.
+    version = db.query(Candidate.version).filter(Candidate.id == candidate_id).scalar()
+    if version is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    etag = _etag(candidate_id, version, projection)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = candidate_cache.get(candidate_id, version)
+    if cached is not None:
+        response.headers["ETag"] = etag
+        return _project(cached, projection)
+
+    cand = (
+        db.query(Candidate)
+        .options(*_load_options(projection))
+        .filter(Candidate.id == candidate_id)
+        .first()
+    )
     if not cand:
         raise HTTPException(status_code=404, detail="Candidate not found")
-    return cand
+    payload = _serialize(cand, projection)
+    if projection is None:
+        candidate_cache.set(cand.id, cand.version, payload)
+    # The row may have been updated between the version lookup and the load.
+    response.headers["ETag"] = _etag(cand.id, cand.version, projection)
+    return payload
@@ -4,6 +4,7 @@ import logging
 from typing import Any, Dict
 from fastapi import APIRouter, Request, HTTPException
 from sqlalchemy.orm import Session
+from ..cache import candidate_cache
 from ..db import SessionLocal
 from ..extract.cv_text import extract_text
 from ..extract.llm import extract_structured
@@ -130,6 +131,8 @@ def _upsert_candidate(fields: Dict[str, object], body: str, phone: str | None, c
             cand.location_city = fields.get("location_city")
             cand.raw_paragraph = body
             cand.cv_text = cv_text
+            # Bump in the UPDATE itself so concurrent upserts can't both write the same version.
+            cand.version = Candidate.version + 1
         else:
             cand = Candidate(
                 phone=effective_phone,
@@ -168,6 +171,7 @@ def _upsert_candidate(fields: Dict[str, object], body: str, phone: str | None, c
             ))
 
         db.commit()
+        candidate_cache.invalidate(cand.id)
         return cand.id, action
     finally:
         db.close()
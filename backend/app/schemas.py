@@ -30,6 +30,7 @@ class CandidateOut(BaseModel):
     email: str | None
     full_name: str | None
     location_city: str | None
+    version: int = 1
     education: List[EducationIn] = []
     experiences: List[ExperienceIn] = []
 
@@ -40,3 +41,19 @@ class CandidateOut(BaseModel):
 class CandidateSearchOut(BaseModel):
     count: int
     items: List[CandidateOut]
+
+
+class CandidatePartialOut(BaseModel):
+    id: int
+    version: int
+    phone: str | None = None
+    email: str | None = None
+    full_name: str | None = None
+    location_city: str | None = None
+    education: List[EducationIn] | None = None
+    experiences: List[ExperienceIn] | None = None
+
+
+class CandidateBatchOut(BaseModel):
+    count: int
+    items: List[CandidatePartialOut]
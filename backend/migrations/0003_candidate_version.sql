@@ -0,0 +1,2 @@
+-- Row version used for candidate ETags and cache invalidation.
+ALTER TABLE candidates ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
@@ -13,6 +13,7 @@ if str(BACKEND_DIR) not in sys.path:
 import pytest
 from fastapi.testclient import TestClient
 
+from app.cache import candidate_cache
 from app.db import Base, SessionLocal, engine
 from app.main import app
 from app.models import Candidate, Experience
@@ -20,6 +21,7 @@ from app.models import Candidate, Experience
 
 @pytest.fixture(autouse=True)
 def clean_db():
+    candidate_cache.clear()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     db = SessionLocal()
@@ -1,3 +1,4 @@
+from app.cache import CandidateCache
 from app.routers import webhooks
 
 
@@ -70,3 +71,77 @@ def test_webhook_accepts_form_payload(client, monkeypatch):
     search_body = search_response.json()
     assert search_body["count"] == 1
     assert search_body["items"][0]["phone"] == "+1000000000"
+
+
+def _seed_candidate(phone="+1000000001", full_name="Jane Doe"):
+    fields = {
+        "full_name": full_name,
+        "education": [{"institution": "Technion", "degree": "BSc"}],
+        "experiences": [{"company": "Acme", "title": "Engineer"}],
+    }
+    candidate_id, _ = webhooks._upsert_candidate(fields, "", phone, "cv")
+    return candidate_id
+
+
+def test_get_candidate_etag_and_not_modified(client):
+    candidate_id = _seed_candidate()
+
+    response = client.get(f"/api/candidates/{candidate_id}")
+    assert response.status_code == 200
+    assert response.json()["version"] == 1
+    assert response.json()["education"][0]["institution"] == "Technion"
+    etag = response.headers["etag"]
+
+    cached = client.get(f"/api/candidates/{candidate_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+def test_upsert_bumps_version_and_invalidates_cache(client):
+    candidate_id = _seed_candidate()
+    first = client.get(f"/api/candidates/{candidate_id}")
+
+    _seed_candidate(full_name="Jane Smith")
+
+    response = client.get(f"/api/candidates/{candidate_id}", headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+    assert response.json()["full_name"] == "Jane Smith"
+    assert response.headers["etag"] != first.headers["etag"]
+
+
+def test_get_candidate_fields_projection(client):
+    candidate_id = _seed_candidate()
+
+    response = client.get(f"/api/candidates/{candidate_id}", params={"fields": "full_name"})
+    assert response.status_code == 200
+    assert response.json() == {"id": candidate_id, "full_name": "Jane Doe", "version": 1}
+
+    bad = client.get(f"/api/candidates/{candidate_id}", params={"fields": "cv_text"})
+    assert bad.status_code == 400
+
+
+def test_get_candidates_batch(client):
+    first = _seed_candidate()
+    second = _seed_candidate(phone="+1000000002", full_name="John Roe")
+
+    response = client.get("/api/candidates", params={"ids": f"{second},{first},999"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 2
+    assert [item["id"] for item in body["items"]] == [second, first]
+    assert body["items"][1]["experiences"][0]["company"] == "Acme"
+
+    bad = client.get("/api/candidates", params={"ids": "1,x"})
+    assert bad.status_code == 400
+
+
+def test_candidate_cache_keeps_newer_entry():
+    cache = CandidateCache(maxsize=2)
+    cache.set(1, 2, {"id": 1, "version": 2})
+
+    assert cache.get(1, 1) is None
+    cache.set(1, 1, {"id": 1, "version": 1})
+    assert cache.get(1, 2) == {"id": 1, "version": 2}
+    assert cache.get(1, 3) is None
+    assert cache.get(1, 2) is None